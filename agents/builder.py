@@ -2,10 +2,10 @@ import logging
 import re
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from crewai import Agent
-
-from tools.file_writer import FileWriterTool
+if TYPE_CHECKING:
+    from crewai import Agent
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +31,17 @@ def git_init(project_dir: Path) -> None:
         logger.warning("Git init failed: %s", exc)
 
 
-def make_builder_agent(config: dict) -> Agent:
+def make_builder_agent(config: dict) -> "Agent":
+    # crewai is imported here so git_init/slugify stay cheap for --recover.
+    from crewai import Agent
+
+    from tools.file_writer import FileWriterBatchTool, FileWriterTool
+
     return Agent(
         role=config["role"],
         goal=config["goal"],
         backstory=config["backstory"],
-        tools=[FileWriterTool()],
+        tools=[FileWriterBatchTool(), FileWriterTool()],
         llm="anthropic/claude-opus-4-6",
         verbose=True,
         max_iter=25,
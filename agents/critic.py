@@ -1,11 +1,12 @@
 from crewai import Agent
 
 
-def make_critic_agent(config: dict) -> Agent:
+def make_critic_agent(config: dict, focus: str | None = None) -> Agent:
+    backstory = f"{config['backstory']} {focus}" if focus else config["backstory"]
     return Agent(
         role=config["role"],
         goal=config["goal"],
-        backstory=config["backstory"],
+        backstory=backstory,
         llm="anthropic/claude-opus-4-6",
         verbose=True,
         max_iter=3,
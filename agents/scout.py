@@ -1,12 +1,6 @@
-import os
-
 from crewai import Agent
 
-from tools.github_scraper import GitHubTrendingTool
-from tools.hn_scraper import HackerNewsTool
-from tools.producthunt_scraper import ProductHuntTool
-from tools.reddit_scraper import RedditTool
-from tools.twitter_scraper import TwitterTool
+from tools.aggregate_scraper import FetchAllTrendingTool
 
 
 def make_scout_agent(config: dict) -> Agent:
@@ -14,14 +8,8 @@ def make_scout_agent(config: dict) -> Agent:
         role=config["role"],
         goal=config["goal"],
         backstory=config["backstory"],
-        tools=[
-            HackerNewsTool(),
-            GitHubTrendingTool(),
-            RedditTool(),
-            ProductHuntTool(),
-            TwitterTool(),
-        ],
+        tools=[FetchAllTrendingTool()],
         llm="anthropic/claude-sonnet-4-6",
         verbose=True,
-        max_iter=15,
+        max_iter=3,
     )
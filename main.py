@@ -1,246 +1,555 @@
 #!/usr/bin/env python3
-"""CLI entry point for the Trend-to-Product pipeline."""
+"""CLI entry point for the Trend-to-Product pipeline.
+
+crewai, yaml, dotenv, the agent factories and the run recorder are imported
+inside the functions that use them, so ``--recover`` and ``--help`` skip
+their import cost.
+"""
 
-import patches  # noqa: F401 — must import before any crewai usage
 import argparse
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import functools
 import json
 import logging
+import logging.handlers
 import os
 import sys
+import threading
+from concurrent.futures import as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
-from crewai import Crew, Process, Task
-from dotenv import load_dotenv
+import orjson
 
-from agents.architect import make_architect_agent
-from agents.builder import git_init, slugify
-from agents.critic import make_critic_agent
-from agents.scout import make_scout_agent
-from storage.recorder import finish_run, start_run
+if TYPE_CHECKING:
+    from crewai import Crew
 
-load_dotenv()
+LOG_DIR = Path("logs")
+STORAGE = Path("storage")
+OUTPUT_DIR = Path("output")
+# Created once at import: the log file handler below and the SQLite engine need them.
+for _dir in (LOG_DIR, STORAGE, OUTPUT_DIR):
+    _dir.mkdir(parents=True, exist_ok=True)
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s – %(message)s"
+# Buffer file records and write them in batches; ERROR and above flush at once.
+# The target needs its own formatter: basicConfig only formats the handlers it is given.
+_file_target = logging.FileHandler(LOG_DIR / "pipeline.log")
+_file_target.setFormatter(logging.Formatter(LOG_FORMAT))
+_file_log = logging.handlers.MemoryHandler(
+    capacity=512,
+    flushLevel=logging.ERROR,
+    target=_file_target,
+)
+atexit.register(_file_log.flush)
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(name)s – %(message)s",
+    format=LOG_FORMAT,
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler(Path("logs") / "pipeline.log"),
+        _file_log,
     ],
 )
 logger = logging.getLogger(__name__)
 
 CONFIG_DIR = Path(__file__).parent / "config"
-STORAGE = Path("storage")
+AGENTS_YAML = CONFIG_DIR / "agents.yaml"
+TASKS_YAML = CONFIG_DIR / "tasks.yaml"
+
+TREND_LIST = STORAGE / "trend_list.json"
+CRITIC_TOP3 = STORAGE / "critic_top3.json"
+CHOSEN_IDEA = STORAGE / "chosen_idea.json"
+DESIGN_SHEET = STORAGE / "design_sheet.md"
+
+_SEP = "─" * 60
+
+PREVIEW_CHARS = 2500  # design sheet characters shown before the approval prompt
+
+_JSON_DECODER = json.JSONDecoder()
+_API_KEY_OK: bool | None = None  # cached result of _check_api_key
+
+
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
+# Scout variants run side by side with differently angled hints; the Critic
+# starts as soon as enough distinct trends have arrived. Each variant returns
+# 10 trends, so the quorum needs at least two of them.
+SCOUT_VARIANTS = 3
+SCOUT_QUORUM = 15
+DRY_RUN_SHOWN = 10  # --dry-run prints this many of the merged trends
+SCOUT_ANGLES = (
+    "",
+    "Favour early signals from small projects over already-mainstream hype.",
+    "Favour trends where businesses are visibly willing to pay for a solution.",
+)
+# Independent critics, each weighting one criterion; their rankings are merged.
+CRITIC_FOCI = (
+    "Weigh technical feasibility for a small team above everything else.",
+    "Weigh novelty and differentiation from existing products above everything else.",
+    "Weigh market size and willingness to pay above everything else.",
+)
+# --topics runs up to MAX_PARALLEL_TOPICS pipelines at once; MAX_CONCURRENT_CREWS
+# caps how many crews hit the LLM API at the same time across all of them.
+MAX_PARALLEL_TOPICS = 4
+MAX_CONCURRENT_CREWS = 6
+_crew_slots = threading.Semaphore(MAX_CONCURRENT_CREWS)
+# Interactive prompts and the shared design sheet are used by one topic at a time.
+_console_lock = threading.Lock()
 
 
 # ── helpers ──────────────────────────────────────────────────────────────────
 
-def _load_yaml(name: str) -> dict:
-    with open(CONFIG_DIR / name) as f:
+@functools.lru_cache(maxsize=4)
+def _load_yaml(path: Path) -> dict:
+    # Cached for the process lifetime; callers must treat the result as read-only.
+    import yaml
+
+    with open(path) as f:
         return yaml.safe_load(f)
 
 
 def _parse_json(text: str):
-    """Extract the first valid JSON object or array from arbitrary text."""
-    import json as _json
-    decoder = _json.JSONDecoder()
-    for start_char in ("{", "["):
-        idx = text.find(start_char)
-        if idx == -1:
-            continue
+    """Extract the first valid JSON object or array from arbitrary text.
+
+    Candidates are tried in order of appearance, so a top-level array is
+    returned whole rather than as its first element, and Markdown fences
+    around the payload are skipped without any regex matching.
+    """
+    idx = 0
+    while True:
+        starts = [i for i in (text.find("{", idx), text.find("[", idx)) if i != -1]
+        if not starts:
+            return None
+        idx = min(starts)
         try:
-            obj, _ = decoder.raw_decode(text, idx)
+            obj, _ = _JSON_DECODER.raw_decode(text, idx)
             return obj
-        except _json.JSONDecodeError:
-            continue
-    return None
-
-
-def _parse_json_file(path: Path):
-    text = path.read_text().strip()
-    return _parse_json(text) if text else None
+        except json.JSONDecodeError:
+            idx += 1
 
 
 def _check_api_key() -> None:
-    if not os.getenv("ANTHROPIC_API_KEY"):
+    global _API_KEY_OK
+    if _API_KEY_OK is None:
+        _API_KEY_OK = bool(os.environ.get("ANTHROPIC_API_KEY"))
+    if not _API_KEY_OK:
         sys.exit("Error: ANTHROPIC_API_KEY is not set. Add it to .env or your environment.")
 
 
-def _run_crew(*args, **kwargs) -> None:
-    Crew(*args, **kwargs, process=Process.sequential, verbose=True).kickoff()
+def _prompt_choice(prompt: str, valid, retry_msg: str) -> str:
+    """Ask until the (lower-cased) answer is in ``valid``, then return it."""
+    while True:
+        choice = input(prompt).strip().lower()
+        if choice in valid:
+            return choice
+        print(retry_msg)
+
+
+def _make_crew(*args, **kwargs) -> "Crew":
+    from crewai import Crew, Process
+
+    return Crew(*args, **kwargs, process=Process.sequential, verbose=True)
+
+
+def _kickoff(crew: "Crew"):
+    with _crew_slots:
+        return crew.kickoff()
+
+
+def _run_crew(*args, **kwargs):
+    return _kickoff(_make_crew(*args, **kwargs))
+
+
+def _start_daemon(
+    fn, *args, slots: threading.Semaphore | None = None, name: str | None = None
+) -> concurrent.futures.Future:
+    """Run ``fn(*args)`` on a daemon thread once one of ``slots`` is free.
+
+    Daemon threads are not joined at exit, so work whose result is no longer
+    wanted does not delay shutdown, provided any threads it starts are daemon
+    too (the scrapers run their blocking fetches through
+    ``tools._http.start_daemon`` for this reason). Cancelling the returned
+    future while it waits for a slot means ``fn`` never starts; once started
+    it runs to completion unless the process exits first.
+    """
+    fut: concurrent.futures.Future = concurrent.futures.Future()
+
+    def target() -> None:
+        with slots or contextlib.nullcontext():
+            if not fut.set_running_or_notify_cancel():
+                return
+            try:
+                fut.set_result(fn(*args))
+            except BaseException as exc:
+                fut.set_exception(exc)
+
+    threading.Thread(target=target, name=name, daemon=True).start()
+    return fut
+
+
+def _kickoff_detached(crew: "Crew") -> asyncio.Future:
+    """Kick off ``crew`` on a daemon thread and return an awaitable for its output."""
+    return asyncio.wrap_future(_start_daemon(crew.kickoff, slots=_crew_slots, name="crew"))
+
+
+def _normalize_title(title: str) -> str:
+    return " ".join(title.lower().split())
+
+
+def _topic_file(path: Path, file_slug: str | None) -> Path:
+    """Storage file for one pipeline: suffixed with ``file_slug`` when --topics runs several."""
+    return path.with_stem(f"{path.stem}-{file_slug}") if file_slug else path
 
 
 # ── pipeline stages ───────────────────────────────────────────────────────────
 
-def _stage_scout(topic: str | None, agents_cfg: dict, tasks_cfg: dict) -> None:
-    topic_hint = f"Pay special attention to trends related to: {topic}." if topic else ""
+def _scout_crew(topic_hint: str, agents_cfg: dict, tasks_cfg: dict) -> "Crew":
+    from crewai import Task
+
+    from agents.scout import make_scout_agent
+
     scout = make_scout_agent(agents_cfg["scout"])
     task = Task(
         description=tasks_cfg["scout_task"]["description"].format(topic_hint=topic_hint),
         expected_output=tasks_cfg["scout_task"]["expected_output"],
         agent=scout,
-        output_file=tasks_cfg["scout_task"]["output_file"],
     )
-    _run_crew(agents=[scout], tasks=[task])
-
-
-def _stage_critic(agents_cfg: dict, tasks_cfg: dict) -> list[dict]:
-    critic = make_critic_agent(agents_cfg["critic"])
+    return _make_crew(agents=[scout], tasks=[task])
+
+
+async def _stage_scout_parallel(
+    topic: str | None,
+    agents_cfg: dict,
+    tasks_cfg: dict,
+    file_slug: str | None = None,
+    k: int = SCOUT_VARIANTS,
+) -> list[dict]:
+    """Run k Scout crews concurrently and merge trends until a quorum is reached.
+
+    Once the quorum is met, crews still waiting for an API slot are cancelled
+    and never start. Crews already running cannot be interrupted: they run to
+    completion on their daemon threads and their results are discarded.
+    """
+    base_hint = f"Pay special attention to trends related to: {topic}." if topic else ""
+    pending = set()
+    for i in range(k):
+        hint = f"{base_hint} {SCOUT_ANGLES[i % len(SCOUT_ANGLES)]}".strip()
+        pending.add(_kickoff_detached(_scout_crew(hint, agents_cfg, tasks_cfg)))
+
+    trends: list[dict] = []
+    seen: set[str] = set()
+    try:
+        while pending and len(trends) < SCOUT_QUORUM:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                if fut.exception():
+                    logger.warning("Scout variant failed: %s", fut.exception())
+                    continue
+                batch = _parse_json(fut.result().raw or "")
+                if not isinstance(batch, list):
+                    logger.warning("Scout variant produced no trend list")
+                    continue
+                for trend in batch:
+                    if not isinstance(trend, dict):
+                        continue
+                    key = _normalize_title(str(trend.get("title", "")))
+                    if key and key not in seen:
+                        seen.add(key)
+                        trends.append(trend)
+    finally:
+        for fut in pending:
+            fut.cancel()
+
+    _topic_file(TREND_LIST, file_slug).write_bytes(_dumps(trends))
+    return trends
+
+
+def _critic_crew(trends: list[dict], focus: str, agents_cfg: dict, tasks_cfg: dict) -> "Crew":
+    from crewai import Task
+
+    from agents.critic import make_critic_agent
+
+    critic = make_critic_agent(agents_cfg["critic"], focus=focus)
     task = Task(
-        description=tasks_cfg["critic_task"]["description"],
+        description=tasks_cfg["critic_task"]["description"].format(
+            trend_list=_dumps(trends).decode()
+        ),
         expected_output=tasks_cfg["critic_task"]["expected_output"],
         agent=critic,
-        output_file=tasks_cfg["critic_task"]["output_file"],
     )
-    _run_crew(agents=[critic], tasks=[task])
-
-    raw = _parse_json_file(STORAGE / "critic_top3.json")
-    if not raw:
-        sys.exit("Critic produced no parseable output.")
-    top3 = raw.get("top3") if isinstance(raw, dict) else raw
-    if not top3:
-        sys.exit("Critic output missing 'top3' list.")
+    return _make_crew(agents=[critic], tasks=[task])
+
+
+async def _stage_critic_parallel(
+    trends: list[dict], agents_cfg: dict, tasks_cfg: dict, file_slug: str | None = None
+) -> list[dict]:
+    """Run one Critic per CRITIC_FOCI entry and keep the three ideas with the best mean rank.
+
+    Each critic's list is taken in the order given; an idea missing from a
+    critic's top 3 counts as rank 4 for that critic.
+    """
+    crews = [_critic_crew(trends, focus, agents_cfg, tasks_cfg) for focus in CRITIC_FOCI]
+    outcomes = await asyncio.gather(
+        *(_kickoff_detached(crew) for crew in crews), return_exceptions=True
+    )
+
+    rankings = []
+    for focus, outcome in zip(CRITIC_FOCI, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning("Critic (%s) failed: %s", focus, outcome)
+            continue
+        raw = _parse_json(outcome.raw or "")
+        top3 = raw.get("top3") if isinstance(raw, dict) else raw
+        if isinstance(top3, list) and top3:
+            rankings.append(top3)
+        else:
+            logger.warning("Critic (%s) produced no 'top3' list", focus)
+    if not rankings:
+        raise RuntimeError("Critic produced no parseable output")
+
+    ideas: dict[str, dict] = {}
+    ranks: dict[str, list[int]] = {}
+    for top3 in rankings:
+        for pos, idea in enumerate(top3[:3], 1):
+            key = _normalize_title(str(idea.get("trend_title", "")))
+            if not key:
+                continue
+            ideas.setdefault(key, idea)
+            ranks.setdefault(key, []).append(pos)
+    missing_rank = 4
+    mean_rank = {
+        key: (sum(r) + missing_rank * (len(rankings) - len(r))) / len(rankings)
+        for key, r in ranks.items()
+    }
+    best = sorted(ideas, key=mean_rank.__getitem__)[:3]
+    top3 = [{**ideas[key], "rank": rank} for rank, key in enumerate(best, 1)]
+
+    _topic_file(CRITIC_TOP3, file_slug).write_bytes(_dumps({"top3": top3}))
     return top3
 
 
-def _prompt_idea_choice(top3: list[dict]) -> dict:
-    SEP = "─" * 60
-    print(f"\n{SEP}")
+def _prompt_idea_choice(top3: list[dict], file_slug: str | None = None) -> dict:
+    print("\n" + _SEP)
     print("  CRITIC'S TOP 3 — you pick which one to build")
-    print(SEP)
+    print(_SEP)
     for idea in top3:
         print(f"\n  [{idea['rank']}]  {idea['trend_title']}")
         print(f"       {idea['one_liner']}")
         print(f"       Feasibility: {idea['feasibility_score']}/10")
         print(f"       Target: {idea['target_user']}")
-    print(f"\n{SEP}")
-    while True:
-        choice = input("  Your choice (1 / 2 / 3): ").strip()
-        if choice in ("1", "2", "3"):
-            chosen = next(x for x in top3 if x["rank"] == int(choice))
-            print(f"\n  → Building: {chosen['trend_title']}\n")
-            (STORAGE / "chosen_idea.json").write_text(json.dumps(chosen, indent=2))
-            return chosen
-        print("  Please enter 1, 2, or 3.")
+    print("\n" + _SEP)
+    by_rank = {str(idea["rank"]): idea for idea in top3}
+    options = " / ".join(by_rank)
+    choice = _prompt_choice(f"  Your choice ({options}): ", by_rank, f"  Please enter {options}.")
+    chosen = by_rank[choice]
+    print(f"\n  → Building: {chosen['trend_title']}\n")
+    _topic_file(CHOSEN_IDEA, file_slug).write_bytes(_dumps(chosen))
+    return chosen
+
 
+def _stage_architect(
+    chosen: dict, agents_cfg: dict, tasks_cfg: dict, file_slug: str | None = None
+) -> None:
+    from crewai import Task
+
+    from agents.architect import make_architect_agent
 
-def _stage_architect(chosen: dict, agents_cfg: dict, tasks_cfg: dict) -> None:
     architect = make_architect_agent(agents_cfg["architect"])
     task = Task(
         description=tasks_cfg["architect_task"]["description"].format(
-            chosen_idea=json.dumps(chosen, indent=2)
+            chosen_idea=_dumps(chosen).decode()
         ),
         expected_output=tasks_cfg["architect_task"]["expected_output"],
         agent=architect,
-        output_file=tasks_cfg["architect_task"]["output_file"],
+        # DESIGN_SHEET rather than the yaml's output_file, so the preview and handoff read the same file.
+        output_file=str(_topic_file(DESIGN_SHEET, file_slug)),
     )
     _run_crew(agents=[architect], tasks=[task])
 
 
-def _prompt_design_approval() -> bool:
-    design_path = STORAGE / "design_sheet.md"
-    text = design_path.read_text() if design_path.exists() else "(design sheet not found)"
-    SEP = "─" * 60
-    print(f"\n{SEP}")
+def _prompt_design_approval(file_slug: str | None = None) -> bool:
+    design_sheet = _topic_file(DESIGN_SHEET, file_slug)
+    if design_sheet.exists():
+        # Read only the preview; the sheet can be much larger than what we show.
+        size = design_sheet.stat().st_size
+        with design_sheet.open(encoding="utf-8") as f:
+            preview = f.read(PREVIEW_CHARS)
+        remaining = size - len(preview.encode("utf-8"))
+    else:
+        preview, remaining = "(design sheet not found)", 0
+    print("\n" + _SEP)
     print("  ARCHITECT'S DESIGN SHEET (preview)")
-    print(SEP)
-    preview = text[:2500]
+    print(_SEP)
     print(preview)
-    if len(text) > 2500:
-        print(f"\n  ... ({len(text) - 2500} more chars — full file: storage/design_sheet.md)")
-    print(f"\n{SEP}")
-    while True:
-        choice = input("  Approve and run Builder? [y/n]: ").strip().lower()
-        if choice in ("y", "yes"):
-            return True
-        if choice in ("n", "no"):
-            return False
-        print("  Please enter y or n.")
+    if remaining > 0:
+        print(f"\n  ... ({remaining} more bytes — full file: {design_sheet})")
+    print("\n" + _SEP)
+    choice = _prompt_choice(
+        "  Approve and run Builder? [y/n]: ", {"y", "yes", "n", "no"}, "  Please enter y or n."
+    )
+    return choice in ("y", "yes")
 
 
-def _stage_builder_handoff(chosen: dict) -> None:
+def _stage_builder_handoff(chosen: dict, file_slug: str | None = None) -> None:
     """Instead of burning API tokens on a Builder agent, hand off to Claude Code."""
+    from agents.builder import slugify
+
+    design_sheet = _topic_file(DESIGN_SHEET, file_slug)
+
     slug = slugify(chosen.get("trend_title", "project"))
-    project_dir = Path("output") / slug
+    project_dir = OUTPUT_DIR / slug
     project_dir.mkdir(parents=True, exist_ok=True)
 
-    SEP = "─" * 60
-    print(f"\n{SEP}")
+    print("\n" + _SEP)
     print("  DESIGN APPROVED — ready to build")
-    print(SEP)
-    print(f"\n  Design sheet : storage/design_sheet.md")
+    print(_SEP)
+    print(f"\n  Design sheet : {design_sheet}")
     print(f"  Output dir   : {project_dir}/")
     print(f"\n  The Builder stage now runs via Claude Code (you) instead")
     print(f"  of the API, saving cost and producing better code.")
     print(f"\n  To build, open a new Claude Code session and run:")
-    print(f"\n    Read the product design at storage/design_sheet.md and")
+    print(f"\n    Read the product design at {design_sheet} and")
     print(f"    implement it as a complete starter project in {project_dir}/")
     print(f"    including backend, tests, Dockerfile, docker-compose, and CI.\n")
-    print(SEP + "\n")
+    print(_SEP + "\n")
 
 
 # ── entry points ──────────────────────────────────────────────────────────────
 
-def _run_pipeline(topic: str | None, dry_run: bool) -> None:
+def _run_pipeline(topic: str | None, dry_run: bool, file_slug: str | None = None) -> None:
+    """Run one pipeline; ``file_slug`` keeps its storage files apart from parallel topics'."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
     _check_api_key()
-    Path("logs").mkdir(exist_ok=True)
-    STORAGE.mkdir(exist_ok=True)
+    import patches  # noqa: F401 — must import before any crewai usage
+    from storage.recorder import finish_run, start_run
 
-    agents_cfg = _load_yaml("agents.yaml")
-    tasks_cfg = _load_yaml("tasks.yaml")
+    agents_cfg = _load_yaml(AGENTS_YAML)
+    tasks_cfg = _load_yaml(TASKS_YAML)
 
     if dry_run:
-        _stage_scout(topic, agents_cfg, tasks_cfg)
-        trend_file = STORAGE / "trend_list.json"
-        trends = _parse_json_file(trend_file) if trend_file.exists() else None
-        if trends:
-            print("\n=== TREND LIST ===")
-            for i, t in enumerate(trends, 1):
-                print(f"{i}. {t.get('title', '?')} — {t.get('why_trending', '')}")
-        else:
-            print("Scout finished — see storage/trend_list.json")
+        trends = asyncio.run(_stage_scout_parallel(topic, agents_cfg, tasks_cfg, file_slug))
+        with _console_lock:
+            if trends:
+                # The merged list starts with the first variant's ranked trends.
+                shown = trends[:DRY_RUN_SHOWN]
+                label = f"top {len(shown)} of {len(trends)} merged"
+                print(f"\n=== TREND LIST ({topic}, {label}) ===" if topic else f"\n=== TREND LIST ({label}) ===")
+                for i, t in enumerate(shown, 1):
+                    print(f"{i}. {t.get('title', '?')} — {t.get('why_trending', '')}")
+            else:
+                print(f"Scout finished — see {_topic_file(TREND_LIST, file_slug)}")
         return
 
-    run_id = start_run(topic=topic)
-    logger.info("Starting run #%d (topic=%s)", run_id, topic)
+    run = start_run(topic=topic)
+    logger.info("Starting run (topic=%s)", topic)
 
     try:
         # Stage 1: Scout
-        logger.info("Stage 1/3 — Scout")
-        _stage_scout(topic, agents_cfg, tasks_cfg)
+        logger.info("Stage 1/3 — Scout (%d variants)", SCOUT_VARIANTS)
+        trends = asyncio.run(_stage_scout_parallel(topic, agents_cfg, tasks_cfg, file_slug))
+        if not trends:
+            raise RuntimeError("Scout produced no parseable trend list")
 
         # Stage 2: Critic → user picks
-        logger.info("Stage 2/3 — Critic")
-        top3 = _stage_critic(agents_cfg, tasks_cfg)
-        chosen = _prompt_idea_choice(top3)
-
-        # Stage 3: Architect → user approves
-        logger.info("Stage 3a — Architect")
-        _stage_architect(chosen, agents_cfg, tasks_cfg)
-        if not _prompt_design_approval():
-            logger.info("User rejected design — pipeline aborted")
-            finish_run(run_id, status="error", error="Aborted by user after design review")
-            sys.exit("Aborted. Edit storage/design_sheet.md or re-run to get a new design.")
-
-        # Stage 4: Handoff to Claude Code
-        logger.info("Stage 3b — Builder handoff")
-        _stage_builder_handoff(chosen)
-        finish_run(run_id, status="success")
+        logger.info("Stage 2/3 — Critic (%d critics)", len(CRITIC_FOCI))
+        top3 = asyncio.run(_stage_critic_parallel(trends, agents_cfg, tasks_cfg, file_slug))
+
+        with _console_lock:
+            if topic:
+                print(f"\n  Topic: {topic}")
+            chosen = _prompt_idea_choice(top3, file_slug)
+
+            # Stage 3: Architect → user approves
+            logger.info("Stage 3a — Architect")
+            _stage_architect(chosen, agents_cfg, tasks_cfg, file_slug)
+            if not _prompt_design_approval(file_slug):
+                logger.info("User rejected design — pipeline aborted")
+                finish_run(run, status="error", error="Aborted by user after design review")
+                sys.exit(
+                    f"Aborted. Edit {_topic_file(DESIGN_SHEET, file_slug)} "
+                    "or re-run to get a new design."
+                )
+
+            # Stage 4: Handoff to Claude Code
+            logger.info("Stage 3b — Builder handoff")
+            _stage_builder_handoff(chosen, file_slug)
+        finish_run(run, status="success")
 
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
-        finish_run(run_id, status="error", error="KeyboardInterrupt")
+        finish_run(run, status="error", error="KeyboardInterrupt")
         sys.exit("\nInterrupted.")
     except Exception as exc:
         logger.exception("Pipeline failed: %s", exc)
-        finish_run(run_id, status="error", error=str(exc))
+        finish_run(run, status="error", error=str(exc))
         sys.exit(f"Pipeline error: {exc}")
+    except SystemExit as exc:
+        # sys.exit() from a stage or helper; finish_run is a no-op if already recorded.
+        finish_run(run, status="error", error=str(exc.code))
+        raise
+
+
+def _run_topics(topics: list[str], dry_run: bool) -> None:
+    """Run one pipeline per topic concurrently; interactive steps take turns.
+
+    Each topic writes its own storage files, suffixed with the topic's slug;
+    main() has already rejected topics whose slugs collide.
+
+    Pipelines run on daemon threads, so Ctrl-C does not wait for topics
+    blocked on a prompt, a crew or a scraper fetch. Open runs are recorded as
+    interrupted, then only the atexit handlers run before exit: the recorder
+    flush, closing the HTTP session and killing the snscrape worker.
+    """
+    from dotenv import load_dotenv
+
+    from agents.builder import slugify
+
+    load_dotenv()
+    _check_api_key()
+    slots = threading.Semaphore(MAX_PARALLEL_TOPICS)
+    futures = {
+        _start_daemon(
+            _run_pipeline, topic, dry_run, slugify(topic), slots=slots, name=f"topic-{i}"
+        ): topic
+        for i, topic in enumerate(topics)
+    }
+    failed = []
+    try:
+        for fut in as_completed(futures):
+            topic = futures[fut]
+            try:
+                fut.result()
+            except SystemExit as exc:
+                logger.error("Topic %r stopped: %s", topic, exc)
+                failed.append(topic)
+            except Exception as exc:
+                logger.exception("Topic %r failed: %s", topic, exc)
+                failed.append(topic)
+    except KeyboardInterrupt:
+        for fut in futures:
+            fut.cancel()
+        logger.info("Interrupted by user")
+        if "storage.recorder" in sys.modules:
+            sys.modules["storage.recorder"].finish_open_runs(
+                status="error", error="KeyboardInterrupt"
+            )
+        sys.exit("\nInterrupted.")
+    if failed:
+        sys.exit(f"{len(failed)} of {len(topics)} topics did not complete: {', '.join(failed)}")
 
 
 def _recover() -> None:
     """Re-run git init on an existing output directory."""
-    dirs = sorted(Path("output").iterdir()) if Path("output").exists() else []
+    from agents.builder import git_init
+
+    dirs = sorted(OUTPUT_DIR.iterdir())
     dirs = [d for d in dirs if d.is_dir()]
     if not dirs:
         sys.exit("No directories found in output/. Run the full pipeline first.")
@@ -255,13 +564,32 @@ def main() -> None:
     mode.add_argument("--run", action="store_true", help="Run the full interactive pipeline")
     mode.add_argument("--dry-run", action="store_true", help="Scout only – print trends and exit")
     mode.add_argument("--recover", action="store_true", help="Replay builder_output.txt without re-running")
-    parser.add_argument("--topic", type=str, default=None, help="Optional topic focus for the Scout")
+    focus = parser.add_mutually_exclusive_group()
+    focus.add_argument("--topic", type=str, default=None, help="Optional topic focus for the Scout")
+    focus.add_argument(
+        "--topics", type=str, default=None, help="Comma-separated topics to run as parallel pipelines"
+    )
 
     args = parser.parse_args()
+    topics = [t.strip() for t in args.topics.split(",") if t.strip()] if args.topics else []
+    if len(topics) > 1:
+        # Each topic's storage files are named after its slug, so slugs must be distinct.
+        from agents.builder import slugify
+
+        by_slug: dict[str, str] = {}
+        for topic in topics:
+            slug = slugify(topic)
+            if not slug:
+                parser.error(f"--topics: {topic!r} has no letters or digits to name its files by")
+            if slug in by_slug:
+                parser.error(f"--topics: {by_slug[slug]!r} and {topic!r} would share storage files")
+            by_slug[slug] = topic
     if args.recover:
         _recover()
+    elif len(topics) > 1:
+        _run_topics(topics, dry_run=args.dry_run)
     else:
-        _run_pipeline(topic=args.topic, dry_run=args.dry_run)
+        _run_pipeline(topic=topics[0] if topics else args.topic, dry_run=args.dry_run)
 
 
 if __name__ == "__main__":
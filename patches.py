@@ -13,11 +13,16 @@ _original_format = AnthropicCompletion._format_messages_for_anthropic
 
 
 def _patched_format(self, messages):
+    # Fast path: almost every call already ends with a user turn, so hand the
+    # list straight through after a single role lookup.
+    if not isinstance(messages, list) or not messages or messages[-1].get("role") != "assistant":
+        return _original_format(self, messages)
+
     # Strip trailing assistant messages so Anthropic never sees a prefill
-    if isinstance(messages, list):
-        while messages and messages[-1].get("role") == "assistant":
-            messages = messages[:-1]
-    return _original_format(self, messages)
+    i = len(messages) - 1
+    while i > 0 and messages[i - 1].get("role") == "assistant":
+        i -= 1
+    return _original_format(self, messages[:i])
 
 
 AnthropicCompletion._format_messages_for_anthropic = _patched_format
@@ -1,12 +1,41 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, Integer, JSON, String, Text, create_engine
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    JSON,
+    String,
+    Text,
+    create_engine,
+    event,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-engine = create_engine("sqlite:///storage/runs.db", echo=False)
+_UTC = timezone.utc
+
+engine = create_engine(
+    "sqlite:///storage/runs.db",
+    echo=False,
+    connect_args={"check_same_thread": False},
+)
 Session = sessionmaker(bind=engine)
 
 
+def _set_sqlite_pragmas(dbapi_conn, _record) -> None:
+    # WAL + NORMAL sync: commits append to the log instead of fsyncing the main db file.
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+event.listen(engine, "connect", _set_sqlite_pragmas)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -15,10 +44,10 @@ class Run(Base):
     __tablename__ = "runs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    started_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, default=lambda: datetime.now(_UTC))
     finished_at = Column(DateTime, nullable=True)
     topic = Column(String(256), nullable=True)
-    status = Column(String(32), default="running")  # running | success | error
+    status = Column(String(32), default="running", index=True)  # running | success | error
     error = Column(Text, nullable=True)
 
 
@@ -26,7 +55,7 @@ class Trend(Base):
     __tablename__ = "trends"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(Integer, nullable=False)
+    run_id = Column(Integer, ForeignKey("runs.id"), nullable=False, index=True)
     source = Column(String(64))
     title = Column(Text)
     url = Column(Text, nullable=True)
@@ -34,5 +63,15 @@ class Trend(Base):
     extra = Column(JSON, nullable=True)
 
 
+def _ensure_indexes(_metadata, connection, **_kw) -> None:
+    # create_all() skips tables that already exist, so databases created before
+    # these indexes were declared get them here.
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_runs_status ON runs (status)"))
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_trends_run_id ON trends (run_id)"))
+
+
+event.listen(Base.metadata, "after_create", _ensure_indexes)
+
+
 def init_db() -> None:
     Base.metadata.create_all(engine)
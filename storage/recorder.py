@@ -1,22 +1,113 @@
-from datetime import datetime
+import atexit
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy import insert
 
 from storage.db import Run, Session, init_db
 
+logger = logging.getLogger(__name__)
+
+_UTC = timezone.utc
+
+FLUSH_INTERVAL = 0.5  # seconds between background flushes of finished runs
+FLUSH_ATTEMPTS = 5  # failed flushes before a queued run is dropped
+
+_initialized = False
+_pending: queue.Queue = queue.Queue()
+_flush_lock = threading.Lock()
+_open_runs: set["RunContext"] = set()  # started but not yet finished
+_open_lock = threading.Lock()
+
+
+@dataclass(eq=False)
+class RunContext:
+    """An in-progress run, kept in memory until finish_run persists it."""
+
+    topic: str | None = None
+    started_at: datetime = field(default_factory=lambda: datetime.now(_UTC))
+    id: int | None = None  # assigned once the row has been written
+    finished: bool = False  # set by the first finish_run; later calls are ignored
+
+
+def _ensure_db() -> None:
+    global _initialized
+    if not _initialized:
+        init_db()
+        _initialized = True
+
+
+def _flush(final: bool = False) -> None:
+    """Insert every queued finished run inside a single transaction.
+
+    On failure the batch goes back on the queue for the next flush; a run
+    that still fails after FLUSH_ATTEMPTS tries, or on the final flush at
+    exit, is logged at ERROR with its values and dropped.
+    """
+    with _flush_lock:
+        finished = []
+        while True:
+            try:
+                finished.append(_pending.get_nowait())
+            except queue.Empty:
+                break
+        if not finished:
+            return
+        try:
+            _ensure_db()
+            with Session() as session, session.begin():
+                for run, values, _ in finished:
+                    stmt = insert(Run).values(
+                        topic=run.topic, started_at=run.started_at, **values
+                    ).returning(Run.id)
+                    run.id = session.execute(stmt).scalar_one()
+        except Exception as exc:
+            logger.warning("Recorder flush failed (%d runs): %s", len(finished), exc)
+            for run, values, attempts in finished:
+                run.id = None
+                if final or attempts + 1 >= FLUSH_ATTEMPTS:
+                    logger.error(
+                        "Dropping run record topic=%r started_at=%s finished_at=%s status=%s error=%r",
+                        run.topic, run.started_at.isoformat(), values["finished_at"].isoformat(),
+                        values["status"], values["error"],
+                    )
+                else:
+                    _pending.put((run, values, attempts + 1))
+
+
+def _writer() -> None:
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        _flush()
+
+
+threading.Thread(target=_writer, name="recorder", daemon=True).start()
+atexit.register(_flush, final=True)
+
+
+def start_run(topic: str | None = None) -> RunContext:
+    run = RunContext(topic=topic)
+    with _open_lock:
+        _open_runs.add(run)
+    return run
+
 
-def start_run(topic: str | None = None) -> int:
-    init_db()
-    with Session() as session:
-        run = Run(topic=topic)
-        session.add(run)
-        session.commit()
-        return run.id
+def finish_run(run: RunContext, status: str = "success", error: str | None = None) -> None:
+    with _open_lock:
+        if run.finished:
+            return
+        run.finished = True
+        _open_runs.discard(run)
+    _pending.put((run, {"finished_at": datetime.now(_UTC), "status": status, "error": error}, 0))
 
 
-def finish_run(run_id: int, status: str = "success", error: str | None = None) -> None:
-    with Session() as session:
-        run = session.get(Run, run_id)
-        if run:
-            run.finished_at = datetime.utcnow()
-            run.status = status
-            run.error = error
-            session.commit()
+def finish_open_runs(status: str = "error", error: str | None = None) -> None:
+    """Finish every run that has been started but not finished, e.g. on Ctrl-C."""
+    with _open_lock:
+        runs = list(_open_runs)
+    for run in runs:
+        finish_run(run, status=status, error=error)
@@ -0,0 +1,80 @@
+"""In-process TTL cache for the scraper fetch functions.
+
+Trending data changes over hours, while the agents often ask for the same
+source several times within minutes. Only successful results are cached:
+a fetch that raises is not stored, so the next call tries again.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import threading
+from collections import Counter
+
+import cachetools
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+
+
+def ttl_cached(ttl: int, maxsize: int = 128):
+    """Cache a sync or async fetch function's result for ``ttl`` seconds per argument set."""
+
+    def decorator(func):
+        cache = cachetools.TTLCache(maxsize=maxsize, ttl=ttl)
+        stats: Counter = Counter()  # per cache, so the logged counts match the function named
+        sig = inspect.signature(func)
+
+        def make_key(args, kwargs) -> str:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return json.dumps(sorted(bound.arguments.items()))
+
+        def lookup(key: str):
+            with _lock:
+                hit = cache.get(key)
+                outcome = "hit" if hit is not None else "miss"
+                stats[outcome] += 1
+                hits, misses = stats["hit"], stats["miss"]
+            logger.debug(
+                "%s.%s cache %s (hits=%d misses=%d)",
+                func.__module__, func.__qualname__, outcome, hits, misses,
+            )
+            return hit
+
+        def store(key: str, value) -> None:
+            with _lock:
+                cache[key] = value
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                hit = lookup(key)
+                if hit is not None:
+                    return hit
+                value = await func(*args, **kwargs)
+                store(key, value)
+                return value
+
+            async_wrapper.cache = cache
+            async_wrapper.cache_stats = stats
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            hit = lookup(key)
+            if hit is not None:
+                return hit
+            value = func(*args, **kwargs)
+            store(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_stats = stats
+        return wrapper
+
+    return decorator
@@ -0,0 +1,92 @@
+"""Shared aiohttp session for the scraper tools.
+
+An aiohttp session is bound to the event loop it was created on, so the
+session and a dedicated event loop live together on a daemon thread. Sync
+callers block on ``run()``, async callers await ``arun()``, and every request
+reuses the same connection pool and DNS cache. Blocking fetches (PRAW,
+snscrape) go through ``start_daemon()`` rather than ``asyncio.to_thread``.
+"""
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Coroutine
+
+import aiohttp
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+_session: aiohttp.ClientSession | None = None
+
+USER_AGENT = "trend_to_product/0.1"
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="scrapers-http", daemon=True).start()
+    return _loop
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared session. Only call from coroutines passed to run()/arun()."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=20, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60
+            ),
+            headers={"User-Agent": USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=15),
+        )
+    return _session
+
+
+def submit(coro: Coroutine[Any, Any, Any]) -> Future:
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop())
+
+
+def run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``coro`` on the shared loop and block until it finishes."""
+    return submit(coro).result()
+
+
+async def arun(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Await ``coro`` on the shared loop from any other event loop."""
+    return await asyncio.wrap_future(submit(coro))
+
+
+def start_daemon(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Run blocking ``fn`` on a daemon thread and return its Future.
+
+    ``asyncio.to_thread`` workers are joined at interpreter exit, so an
+    abandoned fetch would hold up shutdown until it finished; a daemon thread
+    does not. Wrap the result with ``asyncio.wrap_future`` to await it.
+    """
+    fut: Future = Future()
+
+    def target() -> None:
+        if not fut.set_running_or_notify_cancel():
+            return
+        try:
+            fut.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            fut.set_exception(exc)
+
+    threading.Thread(target=target, name=f"fetch-{fn.__name__}", daemon=True).start()
+    return fut
+
+
+def _close() -> None:
+    # Close pooled connections cleanly instead of leaving them to interpreter teardown.
+    if _session is not None and not _session.closed:
+        try:
+            submit(_session.close()).result(timeout=5)
+        except Exception:
+            pass
+
+
+atexit.register(_close)
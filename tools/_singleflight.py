@@ -0,0 +1,77 @@
+"""Coalesce concurrent identical fetches into a single upstream request.
+
+While a call for a given function and argument set is in flight, later
+callers with the same arguments wait for its result instead of issuing their
+own request. Nothing is kept once the call finishes; pair with
+``tools._cache.ttl_cached`` (applied outside this decorator) to memoize it.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import threading
+
+import orjson
+
+_lock = threading.Lock()
+_INFLIGHT: dict[str, concurrent.futures.Future] = {}
+_INFLIGHT_ASYNC: dict[str, asyncio.Future] = {}
+
+
+def singleflight(func):
+    """Deduplicate concurrent calls to a sync or async function with equal arguments."""
+    sig = inspect.signature(func)
+    prefix = f"{func.__module__}.{func.__qualname__}:"
+
+    def make_key(args, kwargs) -> str:
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return prefix + orjson.dumps(bound.arguments, option=orjson.OPT_SORT_KEYS).decode()
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            with _lock:
+                fut = _INFLIGHT_ASYNC.get(key)
+                leader = fut is None
+                if leader:
+                    fut = _INFLIGHT_ASYNC[key] = asyncio.get_running_loop().create_future()
+            if not leader:
+                # shield: a cancelled follower must not cancel the shared call
+                return await asyncio.shield(fut)
+            try:
+                fut.set_result(await func(*args, **kwargs))
+            except asyncio.CancelledError:
+                fut.cancel()
+                raise
+            except BaseException as exc:
+                fut.set_exception(exc)
+            finally:
+                with _lock:
+                    _INFLIGHT_ASYNC.pop(key, None)
+            return fut.result()
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = make_key(args, kwargs)
+        with _lock:
+            fut = _INFLIGHT.get(key)
+            leader = fut is None
+            if leader:
+                fut = _INFLIGHT[key] = concurrent.futures.Future()
+        if not leader:
+            return fut.result()
+        try:
+            fut.set_result(func(*args, **kwargs))
+        except BaseException as exc:
+            fut.set_exception(exc)
+        finally:
+            with _lock:
+                _INFLIGHT.pop(key, None)
+        return fut.result()
+
+    return wrapper
@@ -0,0 +1,25 @@
+"""snscrape search, run in a worker process by ``tools.twitter_scraper``.
+
+Kept apart from the tool module so a spawned worker imports snscrape only,
+not crewai and pydantic.
+"""
+
+# Flatten line breaks and tabs so a tweet title stays on one line.
+TITLE_TBL = str.maketrans("\n\r\t", "   ")
+
+
+def fetch_tweets(query: str, limit: int) -> list[dict]:
+    import snscrape.modules.twitter as sntwitter
+
+    results = []
+    for i, tweet in enumerate(sntwitter.TwitterSearchScraper(query).get_items()):
+        if i >= limit:
+            break
+        results.append({
+            "source": "twitter",
+            "title": tweet.rawContent[:280].translate(TITLE_TBL),
+            "url": tweet.url,
+            "score": tweet.likeCount,
+            "retweets": tweet.retweetCount,
+        })
+    return results
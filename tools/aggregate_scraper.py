@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from typing import Type
+
+import orjson
+from crewai.tools import BaseTool
+from pydantic import BaseModel, ConfigDict, Field
+
+from tools import _http
+from tools.github_scraper import fetch as gh_fetch
+from tools.hn_scraper import fetch as hn_fetch
+from tools.producthunt_scraper import fetch as ph_fetch
+from tools.reddit_scraper import fetch as reddit_fetch
+from tools.twitter_scraper import fetch as twitter_fetch
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ("hackernews", "github_trending", "reddit", "producthunt", "twitter")
+
+
+class FetchAllInput(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    limit: int = Field(default=10, description="Items to fetch per source (per subreddit for Reddit)")
+
+
+async def _fetch_all(limit: int) -> list:
+    # PRAW and snscrape are blocking, so they run on daemon threads alongside
+    # the aiohttp requests; an abandoned Scout's fetch cannot delay exit.
+    return await asyncio.gather(
+        hn_fetch(limit=limit),
+        gh_fetch(),
+        asyncio.wrap_future(_http.start_daemon(reddit_fetch, limit=limit)),
+        ph_fetch(limit=limit),
+        asyncio.wrap_future(_http.start_daemon(twitter_fetch, limit=limit)),
+        return_exceptions=True,
+    )
+
+
+class FetchAllTrendingTool(BaseTool):
+    name: str = "Fetch All Trending"
+    description: str = (
+        "Fetches trending items from Hacker News, GitHub Trending, Reddit, ProductHunt "
+        "and Twitter concurrently. Returns a JSON object keyed by source. Call this once."
+    )
+    args_schema: Type[BaseModel] = FetchAllInput
+
+    def _run(self, limit: int = 10) -> str:
+        outcomes = _http.run(_fetch_all(limit))
+        results = {}
+        for source, outcome in zip(SOURCES, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning("%s fetch failed: %s", source, outcome)
+                outcome = [{"error": str(outcome), "source": source}]
+            results[source] = outcome
+        return orjson.dumps(results).decode()
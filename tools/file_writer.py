@@ -1,36 +1,119 @@
 import logging
+import os
 from pathlib import Path
 from typing import Type
 
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
 
 OUTPUT_DIR = Path("output")
 
+# Parent directories already created in this process, so repeat writes skip mkdir.
+_DIR_CACHE: set[Path] = set()
+
 
 class FileWriterInput(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     project_slug: str = Field(description="Top-level directory name, e.g. 'tradeflow-ai'")
     path: str = Field(description="Relative path inside the project, e.g. 'backend/src/main.ts'")
     content: str = Field(description="Complete file content as a string")
 
 
+class FileSpec(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    path: str = Field(description="Relative path inside the project, e.g. 'backend/src/main.ts'")
+    content: str = Field(description="Complete file content as a string")
+
+
+class FileWriterBatchInput(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    project_slug: str = Field(description="Top-level directory name, e.g. 'tradeflow-ai'")
+    files: list[FileSpec] = Field(description="Files to write, each with a relative path and its content")
+
+
+def _resolve(project_slug: str, path: str) -> Path:
+    file_path = OUTPUT_DIR / project_slug / path
+    if not file_path.resolve().is_relative_to(OUTPUT_DIR.resolve()):
+        raise ValueError(f"{file_path} resolves outside {OUTPUT_DIR}/")
+    return file_path
+
+
+def _ensure_parent(file_path: Path) -> None:
+    parent = file_path.parent
+    if parent not in _DIR_CACHE:
+        parent.mkdir(parents=True, exist_ok=True)
+        _DIR_CACHE.add(parent)
+
+
+def _write_bytes(file_path: Path, data: bytes) -> None:
+    # Raw fd write: no TextIOWrapper for what is usually a small file.
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class FileWriterTool(BaseTool):
     name: str = "Write Project File"
     description: str = (
         "Write one file to the output project directory. "
-        "Call this once per file. Use the same project_slug for every file."
+        "Use the batch tool when writing several files. Use the same project_slug for every file."
     )
     args_schema: Type[BaseModel] = FileWriterInput
 
     def _run(self, project_slug: str, path: str, content: str) -> str:
         try:
-            file_path = OUTPUT_DIR / project_slug / path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content, encoding="utf-8")
+            file_path = _resolve(project_slug, path)
+            _ensure_parent(file_path)
+            _write_bytes(file_path, content.encode("utf-8"))
             logger.info("Wrote %s (%d chars)", file_path, len(content))
             return f"OK: wrote {file_path} ({len(content)} chars)"
         except Exception as exc:
             logger.warning("FileWriterTool error: %s", exc)
             return f"ERROR: {exc}"
+
+
+class FileWriterBatchTool(BaseTool):
+    name: str = "Write Project Files (batch)"
+    description: str = (
+        "Write several files to the output project directory in one call. "
+        "Prefer this over one call per file. Use the same project_slug for every call."
+    )
+    args_schema: Type[BaseModel] = FileWriterBatchInput
+
+    def _run(self, project_slug: str, files: list) -> str:
+        written, errors = [], []
+        resolved = []
+        for spec in files:
+            try:
+                if isinstance(spec, dict):
+                    spec = FileSpec(**spec)
+                resolved.append((_resolve(project_slug, spec.path), spec.content))
+            except Exception as exc:
+                path = spec.get("path", "?") if isinstance(spec, dict) else getattr(spec, "path", "?")
+                errors.append(f"{path}: {exc}")
+
+        # Sorting groups files by directory: each parent is created once and
+        # consecutive writes stay in the same directory.
+        resolved.sort(key=lambda item: (str(item[0].parent), item[0].name))
+        for file_path, content in resolved:
+            try:
+                _ensure_parent(file_path)
+                _write_bytes(file_path, content.encode("utf-8"))
+                written.append(file_path)
+            except Exception as exc:
+                errors.append(f"{file_path}: {exc}")
+
+        logger.info("Wrote %d files under %s", len(written), OUTPUT_DIR / project_slug)
+        if errors:
+            logger.warning("FileWriterBatchTool errors: %s", errors)
+            return f"PARTIAL: wrote {len(written)} files; errors: " + "; ".join(errors)
+        return f"OK: wrote {len(written)} files under {OUTPUT_DIR / project_slug}"
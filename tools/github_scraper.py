@@ -1,50 +1,134 @@
-import json
 import logging
 from typing import Any, Type
 
-import httpx
-from bs4 import BeautifulSoup
+import aiohttp
+import orjson
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from tools import _http
+from tools._cache import ttl_cached
+from tools._singleflight import singleflight
 
 logger = logging.getLogger(__name__)
 
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; trend_to_product/0.1)"}
+
+ROW_SELECTOR = "article.Box-row"
+NAME_SELECTOR = "h2 a"
+DESC_SELECTOR = "p"
+STARS_SELECTOR = "a[href$='/stargazers']"
+
+# Repo names render as "owner /\n  name"; one translate pass strips the whitespace.
+_TITLE_TBL = str.maketrans("", "", "\n\r\t ")
+
+MAX_ROWS = 20
+# Seeing the start of row MAX_ROWS + 1 means the first MAX_ROWS are complete.
+_ROW_MARKER = b'<article class="Box-row"'
+
+# selectolax (Lexbor) is the fast path; BeautifulSoup is the fallback where it
+# cannot be installed (the "bs4" extra), with the selectors compiled once
+# instead of once per row.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    _HAS_LEXBOR = True
+except ImportError:
+    import soupsieve as sv
+    from bs4 import BeautifulSoup
+
+    _HAS_LEXBOR = False
+    _SEL_ROW = sv.compile(ROW_SELECTOR)
+    _SEL_NAME = sv.compile(NAME_SELECTOR)
+    _SEL_DESC = sv.compile(DESC_SELECTOR)
+    _SEL_STARS = sv.compile(STARS_SELECTOR)
+
 
 class GHInput(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     language: str = Field(default="", description="Filter by programming language (optional)")
     since: str = Field(default="weekly", description="Time window: daily | weekly | monthly")
 
 
+def _parse_trending_bs4(html: str) -> list[dict]:
+    soup = BeautifulSoup(html, "html.parser")
+    results = []
+    for repo in _SEL_ROW.select(soup, limit=MAX_ROWS):
+        name_tag = _SEL_NAME.select_one(repo)
+        desc_tag = _SEL_DESC.select_one(repo)
+        stars_tag = _SEL_STARS.select_one(repo)
+        if not name_tag:
+            continue
+        results.append({
+            "source": "github_trending",
+            "title": name_tag.get_text(strip=True).translate(_TITLE_TBL),
+            "description": desc_tag.get_text(strip=True) if desc_tag else "",
+            "stars": stars_tag.get_text(strip=True) if stars_tag else "0",
+            "url": "https://github.com" + (name_tag.get("href") or ""),
+        })
+    return results
+
+
+def _parse_trending(html: str) -> list[dict]:
+    if not _HAS_LEXBOR:
+        return _parse_trending_bs4(html)
+    tree = LexborHTMLParser(html)
+    repos = tree.css(ROW_SELECTOR)
+    results = []
+    for repo in repos[:MAX_ROWS]:
+        name_tag = repo.css_first(NAME_SELECTOR)
+        desc_tag = repo.css_first(DESC_SELECTOR)
+        stars_tag = repo.css_first(STARS_SELECTOR)
+        if not name_tag:
+            continue
+        results.append({
+            "source": "github_trending",
+            "title": name_tag.text(strip=True).translate(_TITLE_TBL),
+            "description": desc_tag.text(strip=True) if desc_tag else "",
+            "stars": stars_tag.text(strip=True) if stars_tag else "0",
+            "url": "https://github.com" + (name_tag.attributes.get("href") or ""),
+        })
+    return results
+
+
+@ttl_cached(ttl=3600)
+@singleflight
+async def fetch(language: str = "", since: str = "weekly") -> list[dict]:
+    """Fetch trending repositories. Must run on the shared loop (see tools._http)."""
+    session = await _http.get_session()
+    async with session.get(
+        f"https://github.com/trending/{language}",
+        params={"since": since},
+        headers=HEADERS,
+        timeout=aiohttp.ClientTimeout(total=15),
+    ) as resp:
+        resp.raise_for_status()
+        # Stop reading once enough rows have arrived; the rest of the page is
+        # footer and scripts. Leaving early closes this one connection.
+        buf = bytearray()
+        rows = 0
+        async for chunk in resp.content.iter_chunked(16 * 1024):
+            scan_from = max(0, len(buf) - len(_ROW_MARKER) + 1)
+            buf += chunk
+            rows += buf.count(_ROW_MARKER, scan_from)
+            if rows > MAX_ROWS:
+                break
+        html = buf.decode(resp.charset or "utf-8", errors="replace")
+    return _parse_trending(html)
+
+
 class GitHubTrendingTool(BaseTool):
     name: str = "GitHub Trending"
     description: str = "Scrapes GitHub Trending page to find popular repositories."
     args_schema: Type[BaseModel] = GHInput
 
     def _run(self, language: str = "", since: str = "weekly") -> str:
+        return _http.run(self._arun(language=language, since=since))
+
+    async def _arun(self, language: str = "", since: str = "weekly") -> str:
         try:
-            url = f"https://github.com/trending/{language}"
-            params = {"since": since}
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; trend_to_product/0.1)"}
-            resp = httpx.get(url, params=params, headers=headers, timeout=15, follow_redirects=True)
-            resp.raise_for_status()
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            repos = soup.select("article.Box-row")
-            results = []
-            for repo in repos[:20]:
-                name_tag = repo.select_one("h2 a")
-                desc_tag = repo.select_one("p")
-                stars_tag = repo.select_one("a[href$='/stargazers']")
-                if not name_tag:
-                    continue
-                results.append({
-                    "source": "github_trending",
-                    "title": name_tag.get_text(strip=True).replace("\n", "").replace(" ", ""),
-                    "description": desc_tag.get_text(strip=True) if desc_tag else "",
-                    "stars": stars_tag.get_text(strip=True) if stars_tag else "0",
-                    "url": "https://github.com" + name_tag["href"],
-                })
-            return json.dumps(results)
+            return orjson.dumps(await _http.arun(fetch(language, since))).decode()
         except Exception as exc:
             logger.warning("GitHub scraper failed: %s", exc)
-            return json.dumps([{"error": str(exc), "source": "github_trending"}])
+            return orjson.dumps([{"error": str(exc), "source": "github_trending"}]).decode()
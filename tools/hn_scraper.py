@@ -1,44 +1,82 @@
-import json
 import logging
 from typing import Any, Type
 
-import httpx
+import aiohttp
+import msgspec
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from tools import _http
+from tools._cache import ttl_cached
+from tools._singleflight import singleflight
 
 logger = logging.getLogger(__name__)
 
+HN_SEARCH_URL = "https://hn.algolia.com/api/v1/search"
+
 
 class HNInput(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     limit: int = Field(default=10, description="Number of HN stories to fetch")
 
 
+def _params(limit: int) -> dict:
+    return {
+        "tags": "front_page",
+        "hitsPerPage": limit,
+    }
+
+
+# Only the fields we keep are declared; msgspec skips the rest of each hit while decoding.
+class Hit(msgspec.Struct):
+    title: str | None = ""
+    url: str | None = ""
+    points: int | None = 0
+    num_comments: int | None = 0
+
+
+class HNResp(msgspec.Struct):
+    hits: list[Hit] = []
+
+
+def _parse_hits(hits: list[Hit]) -> list[dict]:
+    return [
+        {
+            "source": "hackernews",
+            "title": h.title,
+            "url": h.url,
+            "score": h.points,
+            "comments": h.num_comments,
+        }
+        for h in hits
+    ]
+
+
+@ttl_cached(ttl=300)
+@singleflight
+async def fetch(limit: int = 10) -> list[dict]:
+    """Fetch front-page stories. Must run on the shared loop (see tools._http)."""
+    session = await _http.get_session()
+    async with session.get(
+        HN_SEARCH_URL, params=_params(limit), timeout=aiohttp.ClientTimeout(total=10)
+    ) as resp:
+        resp.raise_for_status()
+        data = msgspec.json.decode(await resp.read(), type=HNResp)
+    return _parse_hits(data.hits)
+
+
 class HackerNewsTool(BaseTool):
     name: str = "HackerNews Trends"
     description: str = "Fetches top stories from Hacker News via the Algolia API. No API key required."
     args_schema: Type[BaseModel] = HNInput
 
     def _run(self, limit: int = 10) -> str:
+        return _http.run(self._arun(limit=limit))
+
+    async def _arun(self, limit: int = 10) -> str:
         try:
-            url = "https://hn.algolia.com/api/v1/search"
-            params = {
-                "tags": "front_page",
-                "hitsPerPage": limit,
-            }
-            resp = httpx.get(url, params=params, timeout=10)
-            resp.raise_for_status()
-            hits = resp.json().get("hits", [])
-            results = [
-                {
-                    "source": "hackernews",
-                    "title": h.get("title", ""),
-                    "url": h.get("url", ""),
-                    "score": h.get("points", 0),
-                    "comments": h.get("num_comments", 0),
-                }
-                for h in hits
-            ]
-            return json.dumps(results)
+            return msgspec.json.encode(await _http.arun(fetch(limit))).decode()
         except Exception as exc:
             logger.warning("HN scraper failed: %s", exc)
-            return json.dumps([{"error": str(exc), "source": "hackernews"}])
+            return msgspec.json.encode([{"error": str(exc), "source": "hackernews"}]).decode()
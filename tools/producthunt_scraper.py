@@ -1,11 +1,16 @@
-import json
+import functools
 import logging
 import os
 from typing import Type
 
-import httpx
+import aiohttp
+import msgspec
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from tools import _http
+from tools._cache import ttl_cached
+from tools._singleflight import singleflight
 
 logger = logging.getLogger(__name__)
 
@@ -30,43 +35,117 @@ query TrendingPosts($first: Int!) {
 }
 """
 
+# The query text never changes, so it is JSON-encoded once; only `first` varies.
+_PAYLOAD_TEMPLATE = b'{"query":' + msgspec.json.encode(QUERY) + b',"variables":{"first":%d}}'
+
 
 class PHInput(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     limit: int = Field(default=10, description="Number of ProductHunt posts to fetch")
 
 
+def _headers() -> dict:
+    api_key = os.getenv("PRODUCTHUNT_API_KEY")
+    if not api_key:
+        raise RuntimeError("PRODUCTHUNT_API_KEY not set")
+    return _auth_headers(api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_headers(api_key: str) -> dict:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+# Typed view of the GraphQL response; fields we do not keep are skipped while decoding.
+class _Topic(msgspec.Struct):
+    name: str = ""
+
+
+class _TopicEdge(msgspec.Struct):
+    node: _Topic
+
+
+class _TopicConnection(msgspec.Struct):
+    edges: list[_TopicEdge] = []
+
+
+class _Post(msgspec.Struct):
+    name: str
+    tagline: str | None = ""
+    url: str | None = ""
+    votesCount: int | None = 0
+    topics: _TopicConnection = msgspec.field(default_factory=_TopicConnection)
+
+
+class _PostEdge(msgspec.Struct):
+    node: _Post
+
+
+class _Posts(msgspec.Struct):
+    edges: list[_PostEdge] = []
+
+
+class _Data(msgspec.Struct):
+    posts: _Posts = msgspec.field(default_factory=_Posts)
+
+
+class PHResp(msgspec.Struct):
+    data: _Data | None = None
+    errors: list[dict] = []
+
+
+def _parse_posts(resp: PHResp) -> list[dict]:
+    if resp.errors:
+        raise RuntimeError(resp.errors[0].get("message", "GraphQL error"))
+    if resp.data is None:
+        return []
+    return [
+        {
+            "source": "producthunt",
+            "title": edge.node.name,
+            "tagline": edge.node.tagline,
+            "url": edge.node.url,
+            "votes": edge.node.votesCount,
+            "topics": [t.node.name for t in edge.node.topics.edges],
+        }
+        for edge in resp.data.posts.edges
+    ]
+
+
+@ttl_cached(ttl=1800)
+@singleflight
+async def fetch(limit: int = 10) -> list[dict]:
+    """Fetch top-voted posts. Must run on the shared loop (see tools._http)."""
+    body = _PAYLOAD_TEMPLATE % int(limit)
+    session = await _http.get_session()
+    async with session.post(
+        PH_GRAPHQL_URL, data=body, headers=_headers(), timeout=aiohttp.ClientTimeout(total=15)
+    ) as resp:
+        resp.raise_for_status()
+        data = msgspec.json.decode(await resp.read(), type=PHResp)
+    return _parse_posts(data)
+
+
 class ProductHuntTool(BaseTool):
     name: str = "ProductHunt Trends"
     description: str = "Fetches trending products from ProductHunt via GraphQL v2 API."
     args_schema: Type[BaseModel] = PHInput
 
     def _run(self, limit: int = 10) -> str:
-        api_key = os.getenv("PRODUCTHUNT_API_KEY")
-        if not api_key:
-            return json.dumps([{"error": "PRODUCTHUNT_API_KEY not set", "source": "producthunt"}])
+        return _http.run(self._arun(limit=limit))
+
+    async def _arun(self, limit: int = 10) -> str:
+        if not os.getenv("PRODUCTHUNT_API_KEY"):
+            return msgspec.json.encode(
+                [{"error": "PRODUCTHUNT_API_KEY not set", "source": "producthunt"}]
+            ).decode()
 
         try:
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            }
-            payload = {"query": QUERY, "variables": {"first": limit}}
-            resp = httpx.post(PH_GRAPHQL_URL, json=payload, headers=headers, timeout=15)
-            resp.raise_for_status()
-            edges = resp.json().get("data", {}).get("posts", {}).get("edges", [])
-            results = []
-            for edge in edges:
-                node = edge["node"]
-                topics = [t["node"]["name"] for t in node.get("topics", {}).get("edges", [])]
-                results.append({
-                    "source": "producthunt",
-                    "title": node["name"],
-                    "tagline": node.get("tagline", ""),
-                    "url": node.get("url", ""),
-                    "votes": node.get("votesCount", 0),
-                    "topics": topics,
-                })
-            return json.dumps(results)
+            return msgspec.json.encode(await _http.arun(fetch(limit))).decode()
         except Exception as exc:
             logger.warning("ProductHunt scraper failed: %s", exc)
-            return json.dumps([{"error": str(exc), "source": "producthunt"}])
+            return msgspec.json.encode([{"error": str(exc), "source": "producthunt"}]).decode()
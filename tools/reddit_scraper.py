@@ -1,58 +1,84 @@
-import json
 import logging
 import os
+from concurrent.futures import as_completed
 from typing import Type
 
+import orjson
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from tools import _http
+from tools._cache import ttl_cached
+from tools._singleflight import singleflight
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SUBREDDITS = "startups,SideProject,programming,MachineLearning"
+
 
 class RedditInput(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     subreddits: str = Field(
-        default="startups,SideProject,programming,MachineLearning",
+        default=DEFAULT_SUBREDDITS,
         description="Comma-separated list of subreddits to scrape",
     )
     limit: int = Field(default=10, description="Posts per subreddit")
 
 
+def _fetch_sub(reddit, sub: str, limit: int) -> list[dict]:
+    results = []
+    try:
+        for post in reddit.subreddit(sub).hot(limit=limit):
+            results.append({
+                "source": f"reddit/r/{sub}",
+                "title": post.title,
+                "url": post.url,
+                "score": post.score,
+                "comments": post.num_comments,
+            })
+    except Exception as sub_exc:
+        logger.warning("Reddit r/%s failed: %s", sub, sub_exc)
+    return results
+
+
+@ttl_cached(ttl=180)
+@singleflight
+def fetch(subreddits: str = DEFAULT_SUBREDDITS, limit: int = 10) -> list[dict]:
+    client_id = os.getenv("REDDIT_CLIENT_ID")
+    client_secret = os.getenv("REDDIT_CLIENT_SECRET")
+    user_agent = os.getenv("REDDIT_USER_AGENT", "trend_to_product/0.1")
+
+    if not client_id or not client_secret:
+        raise RuntimeError("REDDIT_CLIENT_ID/SECRET not set")
+
+    import praw
+
+    reddit = praw.Reddit(
+        client_id=client_id,
+        client_secret=client_secret,
+        user_agent=user_agent,
+    )
+    subs = [s.strip() for s in subreddits.split(",") if s.strip()]
+    if not subs:
+        return []
+    # One shared, read-only Reddit instance; each subreddit is fetched on its
+    # own daemon thread, so an abandoned fetch does not hold up exit.
+    results = []
+    futures = [_http.start_daemon(_fetch_sub, reddit, sub, limit) for sub in subs]
+    for future in as_completed(futures):
+        results.extend(future.result())
+    return results
+
+
 class RedditTool(BaseTool):
     name: str = "Reddit Trends"
     description: str = "Fetches hot posts from tech/startup subreddits via PRAW."
     args_schema: Type[BaseModel] = RedditInput
 
-    def _run(self, subreddits: str = "startups,SideProject,programming,MachineLearning", limit: int = 10) -> str:
-        client_id = os.getenv("REDDIT_CLIENT_ID")
-        client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-        user_agent = os.getenv("REDDIT_USER_AGENT", "trend_to_product/0.1")
-
-        if not client_id or not client_secret:
-            return json.dumps([{"error": "REDDIT_CLIENT_ID/SECRET not set", "source": "reddit"}])
-
+    def _run(self, subreddits: str = DEFAULT_SUBREDDITS, limit: int = 10) -> str:
         try:
-            import praw
-
-            reddit = praw.Reddit(
-                client_id=client_id,
-                client_secret=client_secret,
-                user_agent=user_agent,
-            )
-            results = []
-            for sub in subreddits.split(","):
-                sub = sub.strip()
-                try:
-                    for post in reddit.subreddit(sub).hot(limit=limit):
-                        results.append({
-                            "source": f"reddit/r/{sub}",
-                            "title": post.title,
-                            "url": post.url,
-                            "score": post.score,
-                            "comments": post.num_comments,
-                        })
-                except Exception as sub_exc:
-                    logger.warning("Reddit r/%s failed: %s", sub, sub_exc)
-            return json.dumps(results)
+            return orjson.dumps(fetch(subreddits, limit)).decode()
         except Exception as exc:
             logger.warning("Reddit scraper failed: %s", exc)
-            return json.dumps([{"error": str(exc), "source": "reddit"}])
+            return orjson.dumps([{"error": str(exc), "source": "reddit"}]).decode()
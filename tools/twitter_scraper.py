@@ -1,34 +1,82 @@
-import json
+import atexit
 import logging
+import multiprocessing
+import multiprocessing.pool
 import subprocess
+import threading
 from typing import Type
 
+import orjson
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from tools._cache import ttl_cached
+from tools._singleflight import singleflight
+from tools._snscrape_worker import TITLE_TBL as _TITLE_TBL
+from tools._snscrape_worker import fetch_tweets
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_QUERY = "#buildinpublic OR #indiehacker"
+SUBPROCESS_TIMEOUT = 30  # seconds before the snscrape CLI fallback or worker is killed
+WORKER_MAX_TASKS = 10  # recycle the worker so snscrape's memory growth cannot accumulate
 
-class TwitterInput(BaseModel):
-    query: str = Field(default="#buildinpublic OR #indiehacker", description="Twitter search query")
-    limit: int = Field(default=20, description="Max number of tweets")
+# Resolved once: snscrape is either importable here or we go straight to the CLI.
+# Broad except because some snscrape releases fail at import time on newer Pythons.
+try:
+    import snscrape.modules.twitter  # noqa: F401
 
+    _HAS_SN = True
+except Exception:
+    _HAS_SN = False
 
-def _fetch_via_module(query: str, limit: int) -> list[dict]:
-    import snscrape.modules.twitter as sntwitter
 
-    results = []
-    for i, tweet in enumerate(sntwitter.TwitterSearchScraper(query).get_items()):
-        if i >= limit:
-            break
-        results.append({
-            "source": "twitter",
-            "title": tweet.rawContent[:280],
-            "url": tweet.url,
-            "score": tweet.likeCount,
-            "retweets": tweet.retweetCount,
-        })
-    return results
+# snscrape's page parsing is CPU-bound, so it runs in its own process instead of
+# competing with the agents for the GIL. The worker is spawned rather than
+# forked, since this process already runs the HTTP loop, recorder and crew
+# threads. Created on first use.
+_POOL: multiprocessing.pool.Pool | None = None
+# One search at a time: the timeout then measures the search, not queueing
+# behind another caller's.
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool() -> multiprocessing.pool.Pool:
+    global _POOL
+    if _POOL is None:
+        _POOL = multiprocessing.get_context("spawn").Pool(
+            processes=1, maxtasksperchild=WORKER_MAX_TASKS
+        )
+    return _POOL
+
+
+def _terminate_pool() -> None:
+    # terminate() kills the worker; a hung snscrape must not outlive the call or block exit.
+    global _POOL
+    if _POOL is not None:
+        _POOL.terminate()
+        _POOL = None
+
+
+def _fetch_via_worker(query: str, limit: int) -> list[dict]:
+    with _POOL_LOCK:
+        result = _get_pool().apply_async(fetch_tweets, (query, limit))
+        try:
+            return result.get(timeout=SUBPROCESS_TIMEOUT)
+        except multiprocessing.TimeoutError:
+            # Also covers a worker that died mid-task: its result never arrives.
+            _terminate_pool()
+            raise TimeoutError(f"snscrape worker gave no result within {SUBPROCESS_TIMEOUT}s")
+
+
+atexit.register(_terminate_pool)
+
+
+class TwitterInput(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    query: str = Field(default=DEFAULT_QUERY, description="Twitter search query")
+    limit: int = Field(default=20, description="Max number of tweets")
 
 
 def _fetch_via_subprocess(query: str, limit: int) -> list[dict]:
@@ -37,40 +85,58 @@ def _fetch_via_subprocess(query: str, limit: int) -> list[dict]:
         "--jsonl", f"--max-results={limit}",
         "twitter-search", query,
     ]
-    proc = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    # Stream the JSONL output and stop at `limit` rather than buffering it all;
+    # the timer replaces subprocess.run's timeout.
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    killer = threading.Timer(SUBPROCESS_TIMEOUT, proc.kill)
+    killer.daemon = True  # an abandoned fetch must not keep the interpreter alive
+    killer.start()
     results = []
-    for line in proc.stdout.splitlines():
-        try:
-            data = json.loads(line)
-            results.append({
-                "source": "twitter",
-                "title": data.get("content", "")[:280],
-                "url": data.get("url", ""),
-                "score": data.get("likeCount", 0),
-                "retweets": data.get("retweetCount", 0),
-            })
-        except Exception:
-            continue
+    try:
+        for line in proc.stdout:
+            try:
+                data = orjson.loads(line)
+                results.append({
+                    "source": "twitter",
+                    "title": (data.get("content") or "")[:280].translate(_TITLE_TBL),
+                    "url": data.get("url", ""),
+                    "score": data.get("likeCount", 0),
+                    "retweets": data.get("retweetCount", 0),
+                })
+            except Exception:
+                continue
+            if len(results) >= limit:
+                break
+    finally:
+        killer.cancel()
+        if proc.poll() is None:
+            proc.terminate()
+        proc.stdout.close()
+        proc.wait()
     return results
 
 
+@ttl_cached(ttl=180)
+@singleflight
+def fetch(query: str = DEFAULT_QUERY, limit: int = 20) -> list[dict]:
+    if _HAS_SN:
+        try:
+            return _fetch_via_worker(query, limit)
+        except Exception as exc:
+            logger.warning("snscrape module failed: %s", exc)
+    else:
+        logger.warning("snscrape module unavailable, using subprocess fallback")
+    return _fetch_via_subprocess(query, limit)
+
+
 class TwitterTool(BaseTool):
     name: str = "Twitter Trends"
     description: str = "Searches Twitter for trending tech/startup content via snscrape."
     args_schema: Type[BaseModel] = TwitterInput
 
-    def _run(self, query: str = "#buildinpublic OR #indiehacker", limit: int = 20) -> str:
-        try:
-            results = _fetch_via_module(query, limit)
-            return json.dumps(results)
-        except ImportError:
-            logger.warning("snscrape module import failed, trying subprocess fallback")
-        except Exception as exc:
-            logger.warning("snscrape module failed: %s", exc)
-
+    def _run(self, query: str = DEFAULT_QUERY, limit: int = 20) -> str:
         try:
-            results = _fetch_via_subprocess(query, limit)
-            return json.dumps(results)
+            return orjson.dumps(fetch(query, limit)).decode()
         except Exception as exc:
             logger.warning("Twitter subprocess fallback failed: %s", exc)
-            return json.dumps([{"error": str(exc), "source": "twitter"}])
+            return orjson.dumps([{"error": str(exc), "source": "twitter"}]).decode()